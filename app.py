@@ -1,16 +1,31 @@
 # app.py — Night Owls (Shiny for Python, Posit Cloud-ready)
-# Requires: shiny, pandas, numpy, pillow, gspread, google-auth, python-dotenv (optional)
+# Requires: shiny, pandas, numpy, pillow, gspread, google-auth, python-dotenv, orjson (optional)
 
 from __future__ import annotations
-import os, io, json, math, random, base64, datetime as dt
+import os, json, math, random, time, html, threading, asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from string import Template
+from bisect import bisect_right
 from typing import Optional, Tuple, List, Dict
 
 import pandas as pd
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 
 from shiny import App, ui, reactive, render, req, session as shiny_session
 
+try:  # optional: faster JSON for complications tables and ledger breakdowns
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def json_dumps(obj) -> str:
+    # Compact either way, so sheet cells look the same with or without orjson
+    return orjson.dumps(obj).decode("utf-8") if orjson else json.dumps(obj, separators=(",", ":"))
+
 # ------------------------------ Config & Assets ------------------------------
 
 APP_TITLE = "Night Owls — Waterdeep Secret Club"
@@ -21,8 +36,16 @@ COLUMNS = [
     "timestamp","ward","archetype","BI","EB","OQM",
     "renown_gain","notoriety_gain","EI_breakdown","notes","complication"
 ]
+NUMERIC_COLUMNS = ["BI","EB","OQM","renown_gain","notoriety_gain"]
+WARDS = ("Dock","Field","South","North","Castle","Trades","Sea")
 
+APP_DIR    = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = "assets"
+CSV_CHUNK_ROWS = 500
+LEDGER_VIEW_ROWS = 500  # on-screen table shows the most recent rows; the CSV has everything
+
+WHEEL_SIZE = 600
+
 BG_CANDIDATES = [f"{ASSETS_DIR}/bg.webp", f"{ASSETS_DIR}/bg.png"]
 LOGO_CANDIDATES = [f"{ASSETS_DIR}/logo.webp", f"{ASSETS_DIR}/logo.png"]
 RENOWN_IMG_CANDIDATES = [f"{ASSETS_DIR}/renown_gold.webp", f"{ASSETS_DIR}/renown_gold.png"]
@@ -32,33 +55,65 @@ MURAL_CANDIDATES = [f"{ASSETS_DIR}/mural_sidebar.webp", f"{ASSETS_DIR}/mural_sid
 LOW_TABLE  = f"{ASSETS_DIR}/complications_low.json"
 HIGH_TABLE = f"{ASSETS_DIR}/complications_high.json"
 
-def _b64_from_file(paths: List[str]) -> str:
+def _scan_assets() -> frozenset:
+    try:
+        with os.scandir(ASSETS_DIR) as it:
+            return frozenset(f"{ASSETS_DIR}/{e.name}" for e in it if e.is_file())
+    except OSError:
+        return frozenset()
+
+# One directory scan at startup; candidate lookups are then set membership, not filesystem probes
+ASSET_INDEX = _scan_assets()
+
+def _first_existing(paths):
     for p in paths:
-        try:
-            with open(p, "rb") as f:
-                return base64.b64encode(f.read()).decode("utf-8")
-        except Exception:
-            continue
-    return ""
-
-BG_B64     = _b64_from_file(BG_CANDIDATES)
-LOGO_B64   = _b64_from_file(LOGO_CANDIDATES)
-RENOWN_B64 = _b64_from_file(RENOWN_IMG_CANDIDATES)
-NOTOR_B64  = _b64_from_file(NOTOR_IMG_CANDIDATES)
-MURAL_B64  = _b64_from_file(MURAL_CANDIDATES)
+        if p in ASSET_INDEX:
+            return p
+    return None
+
+# Images are served from the static assets mount (see App below) so the browser fetches and
+# caches them once; the relative file path doubles as the URL.
+BG_URL     = _first_existing(BG_CANDIDATES) or ""
+LOGO_URL   = _first_existing(LOGO_CANDIDATES) or ""
+MURAL_URL  = _first_existing(MURAL_CANDIDATES) or ""
+RENOWN_URL = _first_existing(RENOWN_IMG_CANDIDATES) or ""
+NOTOR_URL  = _first_existing(NOTOR_IMG_CANDIDATES) or ""
 
 from functools import lru_cache
 
 @lru_cache(maxsize=32)
-def ward_image_b64(ward: str) -> str:
-    """Return base64 PNG for the selected ward (tries a few common filename variants)."""
+def ward_image_url(ward: str) -> str:
+    """Return the asset URL for the selected ward (tries a few common filename variants)."""
     safe = (ward or "").strip().replace(" ", "_")
-    return _b64_from_file([
+    return _first_existing([
         f"{ASSETS_DIR}/{safe}_Ward.png",
         f"{ASSETS_DIR}/{safe}_ward.png",
         f"{ASSETS_DIR}/{safe}.png",
         f"{ASSETS_DIR}/{safe}-Ward.png",
-    ])
+    ]) or ""
+
+PLACEHOLDER_COMPLICATIONS = tuple(f"Complication {i}" for i in range(1, 13))
+
+@lru_cache(maxsize=4)
+def load_complications(path: str) -> Tuple[str, ...]:
+    """Read and normalise a complications table once per process (falls back to numbered placeholders)."""
+    try:
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
+    except Exception:
+        data = None
+    if not data or not isinstance(data, list):
+        return PLACEHOLDER_COMPLICATIONS
+    # Tables are homogeneous, so the first entry decides the shape
+    first = data[0]
+    try:
+        if isinstance(first, str):
+            return tuple(data)
+        if isinstance(first, dict) and "text" in first:
+            return tuple(str(x["text"]) for x in data)
+        return tuple(str(x) for x in data)
+    except (KeyError, TypeError):
+        return PLACEHOLDER_COMPLICATIONS
 
 # ------------------------------ Google Sheets (optional) ------------------------------
 
@@ -84,63 +139,210 @@ def _get_sheets_cfg() -> Tuple[Optional[dict], Optional[str], str, Optional[str]
 def _build_gspread_client(sa_json: dict):
     import gspread
     from google.oauth2.service_account import Credentials
-    scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+    scopes = ["https://www.googleapis.com/auth/spreadsheets",
+              "https://www.googleapis.com/auth/drive.metadata.readonly"]
     creds = Credentials.from_service_account_info(sa_json, scopes=scopes)
     return gspread.authorize(creds)
 
-def _ensure_worksheet(sa_json, sheet_id, worksheet_name="Log") -> Tuple[bool, Optional[str]]:
-    try:
+# Rate limits (429) and transient server errors are retried with a short jittered backoff;
+# kept brief because the Sheets worker is held while it waits. Queued rows survive a final failure.
+# Appends only retry 429: a 5xx may arrive after the rows were written, and a retry would duplicate them.
+SHEETS_RETRY_CODES = frozenset({429, 500, 503})
+SHEETS_WRITE_RETRY_CODES = frozenset({429})
+SHEETS_RETRIES = 3
+
+def _with_retry(fn, *args, retry_codes=SHEETS_RETRY_CODES, **kwargs):
+    import gspread
+    for attempt in range(SHEETS_RETRIES):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            code = getattr(getattr(e, "response", None), "status_code", 0)
+            if code not in retry_codes or attempt == SHEETS_RETRIES - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt + random.random() * 0.25)
+
+# Authorised clients keyed by service account; gspread refreshes their tokens itself, so a
+# failed call never needs a fresh client (and a fresh token fetch).
+_CLIENT_CACHE: dict = {}
+
+def _get_client(sa_json: dict):
+    key = (sa_json.get("client_email"), sa_json.get("private_key_id"))
+    gc = _CLIENT_CACHE.get(key)
+    if gc is None:
+        gc = _CLIENT_CACHE[key] = _build_gspread_client(sa_json)
+    return gc
+
+# Worksheet handles keyed by (sheet_id, ws_name); opening one costs two metadata round-trips.
+_WS_CACHE: dict = {}
+
+def _get_worksheet(sa_json, sheet_id, worksheet_name="Log"):
+    key = (sheet_id, worksheet_name)
+    ws = _WS_CACHE.get(key)
+    if ws is None:
         import gspread
-        gc = _build_gspread_client(sa_json)
-        sh = gc.open_by_key(sheet_id)
+        sh = _with_retry(_get_client(sa_json).open_by_key, sheet_id)
         try:
-            sh.worksheet(worksheet_name)
+            ws = _with_retry(sh.worksheet, worksheet_name)
         except gspread.exceptions.WorksheetNotFound:
             ws = sh.add_worksheet(title=worksheet_name, rows="1000", cols="20")
             ws.append_row(COLUMNS)
-        return True, None
-    except Exception as e:
-        return False, str(e)
+        _WS_CACHE[key] = ws
+    return ws
 
 def append_rows_to_sheet(rows: List[List]) -> Tuple[bool, Optional[str]]:
     sa_json, sheet_id, ws_name, err = _get_sheets_cfg()
     if err:
         return False, err
-    ok, err = _ensure_worksheet(sa_json, sheet_id, worksheet_name=ws_name)
-    if not ok:
-        return False, err
     try:
-        gc = _build_gspread_client(sa_json)
-        sh = gc.open_by_key(sheet_id)
-        ws = sh.worksheet(ws_name)
-        for r in rows:
-            ws.append_row(r, value_input_option="USER_ENTERED")
+        ws = _get_worksheet(sa_json, sheet_id, worksheet_name=ws_name)
+        _with_retry(ws.append_rows, rows, value_input_option="USER_ENTERED",  # one request for the whole batch
+                    retry_codes=SHEETS_WRITE_RETRY_CODES)
         return True, None
     except Exception as e:
+        _WS_CACHE.pop((sheet_id, ws_name), None)  # tab renamed/deleted or token dropped: reopen next time
         return False, str(e)
 
+# Rows logged by the buttons wait here and go out together: every SHEETS_BATCH_ROWS
+# entries, every SHEETS_FLUSH_SECS, on tab switch, or when the session ends.
+SHEETS_BATCH_ROWS = 5
+SHEETS_FLUSH_SECS = 5
+sheet_queue: List[List] = []
+_sheet_lock = threading.Lock()
+
+# Background flushes back off exponentially after a failure (wrong sheet, lost permission,
+# outage), shared by every session; explicit actions still go through.
+SHEETS_BACKOFF_MAX = 600
+_flush_fails = 0
+_flush_next_at = 0.0
+# (count, message) of background flush failures; sessions report ones newer than they've seen
+_flush_error: Tuple[int, Optional[str]] = (0, None)
+
+# All Sheets traffic from handlers runs on one worker thread: writes leave the event loop
+# immediately, and a single worker keeps appends and reloads in submission order.
+SHEETS_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets")
+
+def _backing_off() -> bool:
+    return time.monotonic() < _flush_next_at
+
+def _note_sheets_result(ok: bool, err: Optional[str] = None) -> None:
+    """Reset or extend the flush backoff (and record err for reporting); call with _sheet_lock held."""
+    global _flush_fails, _flush_next_at, _flush_error
+    if ok:
+        _flush_fails, _flush_next_at = 0, 0.0
+    else:
+        _flush_fails += 1
+        _flush_next_at = time.monotonic() + min(SHEETS_BACKOFF_MAX, SHEETS_FLUSH_SECS * 2 ** _flush_fails)
+        if err:
+            _flush_error = (_flush_error[0] + 1, err)
+
+def _flush_now(force: bool = False) -> Tuple[bool, Optional[str]]:
+    with _sheet_lock:
+        rows = [] if (_backing_off() and not force) else sheet_queue[:]
+    if not rows:
+        return True, None
+    ok, err = append_rows_to_sheet(rows)
+    with _sheet_lock:
+        if ok:
+            del sheet_queue[:len(rows)]
+        _note_sheets_result(ok, err)
+    if ok:
+        save_pending_rows()
+    return ok, err
+
+def flush_sheet_queue(force: bool = False) -> Optional[Future]:
+    """Send pending rows in the background; returns the Future, or None if there's nothing to do.
+
+    Unless forced, nothing is sent while backing off from a failed flush."""
+    if not sheet_queue or (_backing_off() and not force):
+        return None
+    return SHEETS_EXEC.submit(_flush_now, force)
+
+def queue_sheet_rows(rows: List[List]) -> None:
+    if _get_sheets_cfg()[3]:
+        return  # Sheets not configured; nothing to sync
+    with _sheet_lock:
+        sheet_queue.extend(rows)
+        full = len(sheet_queue) >= SHEETS_BATCH_ROWS
+    if full:
+        flush_sheet_queue()
+
+def align_ledger_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Unheaded extra columns all come back named "", and reindex refuses duplicate labels
+    return df.loc[:, ~df.columns.duplicated()].reindex(columns=COLUMNS, fill_value="")
+
+# Last parsed ledger per worksheet, tagged with the Drive modifiedTime it was read at
+_LEDGER_CACHE: dict = {}
+
+def _sheet_revision(ws) -> Optional[str]:
+    # One small Drive metadata call; None (always refetch) if the scope isn't granted
+    try:
+        return ws.client.get_file_drive_metadata(ws.spreadsheet_id).get("modifiedTime")
+    except Exception:
+        return None
+
 def load_ledger_from_sheet() -> Tuple[pd.DataFrame, Optional[str]]:
     sa_json, sheet_id, ws_name, err = _get_sheets_cfg()
     if err:
         return pd.DataFrame(columns=COLUMNS), err
-    ok, err = _ensure_worksheet(sa_json, sheet_id, worksheet_name=ws_name)
-    if not ok:
-        return pd.DataFrame(columns=COLUMNS), err
     try:
-        gc = _build_gspread_client(sa_json)
-        sh = gc.open_by_key(sheet_id)
-        ws = sh.worksheet(ws_name)
-        values = ws.get_all_values()
+        ws = _get_worksheet(sa_json, sheet_id, worksheet_name=ws_name)
+        key = (sheet_id, ws_name)
+        rev = _sheet_revision(ws)
+        hit = _LEDGER_CACHE.get(key)
+        if rev and hit and hit[0] == rev:
+            return hit[1], None
+        values = _with_retry(ws.get_all_values)
         if not values:
             return pd.DataFrame(columns=COLUMNS), None
-        df = pd.DataFrame(values[1:], columns=values[0])
-        for col in ["BI","EB","OQM","renown_gain","notoriety_gain"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(float)
+        # Cells arrive as strings; skip inference, align to the ledger schema, coerce numerics in one block
+        df = align_ledger_columns(pd.DataFrame(values[1:], columns=values[0], dtype=object))
+        df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce").fillna(0.0).astype(float)
+        if rev:
+            _LEDGER_CACHE[key] = (rev, df)
         return df, None
     except Exception as e:
+        _WS_CACHE.pop((sheet_id, ws_name), None)
         return pd.DataFrame(columns=COLUMNS), str(e)
 
+# Local copy of the ledger, rewritten from the flush timer after changes and used at startup when Sheets is
+# unreachable (or not configured), so a restart doesn't lose the session's log. Rows still waiting
+# in sheet_queue are kept beside it and queued again at startup, so an outage can't strand them.
+LEDGER_SNAPSHOT = os.environ.get("LEDGER_SNAPSHOT", "").strip() or os.path.join(APP_DIR, ".cache", "ledger.json")
+LEDGER_PENDING = os.path.splitext(LEDGER_SNAPSHOT)[0] + ".pending.json"
+
+def _write_rows(path: str, rows: List[List]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json_dumps(rows))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # best effort; Sheets stays the source of truth
+
+def _read_rows(path: str) -> List[List]:
+    try:
+        with open(path, "rb") as f:
+            rows = json_loads(f.read())
+    except (OSError, ValueError):
+        return []
+    return [list(r) for r in rows if len(r) == len(COLUMNS)]
+
+def save_ledger_snapshot(rows: List[List]) -> None:
+    _write_rows(LEDGER_SNAPSHOT, rows)
+
+def load_ledger_snapshot() -> List[List]:
+    return _read_rows(LEDGER_SNAPSHOT)
+
+def save_pending_rows() -> None:
+    with _sheet_lock:
+        rows = sheet_queue[:]
+    _write_rows(LEDGER_PENDING, rows)
+
+def load_pending_rows() -> List[List]:
+    return _read_rows(LEDGER_PENDING)
+
 # ------------------------------ Mechanics ------------------------------
 
 # ---------- Points thresholds ----------
@@ -160,10 +362,15 @@ def points_to_next(total: float, thresholds: list[int]) -> tuple[float, int|None
             return round(th - total, 2), i
     return 0.0, None
 
-def mission_count(df: pd.DataFrame) -> int:
-    if df.empty or "archetype" not in df.columns: return 0
-    mask = df["archetype"].isin(["Help the Poor","Sabotage Evil","Expose Corruption"])
-    return int(mask.sum())
+MISSION_ARCS = frozenset(["Help the Poor","Sabotage Evil","Expose Corruption"])
+_ARC_COL = COLUMNS.index("archetype")
+
+def now_stamp() -> str:
+    """Local timestamp for ledger rows, same shape as isoformat(timespec="seconds")."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+def mission_count(rows: List[List]) -> int:
+    return sum(1 for r in rows if r[_ARC_COL] in MISSION_ARCS)
 
 # ---------- Points award functions ----------
 # ---------- Points Engine (drop-in replace) ----------
@@ -260,11 +467,12 @@ def notoriety_points_from(*, gold: float, missions: int, arc: str,
 def clamp(v, lo, hi): return max(lo, min(hi, v))
 def heat_multiplier(n): return 1.5 if n>=20 else (1.25 if n>=10 else 1.0)
 
+# Spend band edges for "Help the Poor": <25 -> 1, <50 -> 2, <100 -> 3, <200 -> 4, else 5
+SPEND_BINS = (25, 50, 100, 200)
+
 def compute_BI(arc: str, inputs: Dict[str,int]) -> int:
     if arc == "Help the Poor":
-        spend = inputs.get("spend", 0)
-        sb = 1 if spend < 25 else 2 if spend < 50 else 3 if spend < 100 else 4 if spend < 200 else 5
-        return sb  # hb was undefined
+        return bisect_right(SPEND_BINS, inputs.get("spend", 0)) + 1  # hb was undefined
     if arc == "Sabotage Evil":
         return inputs.get("impact_level", 1)
     return inputs.get("expose_level", 1)
@@ -272,9 +480,10 @@ def compute_BI(arc: str, inputs: Dict[str,int]) -> int:
 def compute_base_score(BI:int, EB:int, OQM_list:List[int]) -> int:
     return clamp(BI + EB + clamp(sum(OQM_list), -2, 2), 1, 7)
 
+SCORE_ARC_MULT = {"Help the Poor":1.0,"Sabotage Evil":1.5,"Expose Corruption":2.0}
+
 def renown_from_score(base:int, arc:str) -> int:
-    mult = {"Help the Poor":1.0,"Sabotage Evil":1.5,"Expose Corruption":2.0}[arc]
-    return int(round(base*mult))
+    return int(round(base*SCORE_ARC_MULT[arc]))
 
 def notoriety_gain(cat_base:int, EI:int, n:int) -> int:
     return max(0, math.ceil((cat_base + max(0, EI-1)) * heat_multiplier(n)))
@@ -282,40 +491,57 @@ def notoriety_gain(cat_base:int, EI:int, n:int) -> int:
 def low_or_high(n:int) -> str:
     return "High" if n>=10 else "Low"
 
-def draw_wheel(labels: List[str], size:int=600, cols: Optional[List[str]]=None) -> Image.Image:
-    n = len(labels)
-    img = Image.new("RGBA", (size, size), (0,0,0,0))
-    d = ImageDraw.Draw(img)
-    cx, cy = size//2, size//2
-    r = size//2 - 6
-    palette = cols or ["#173b5a", "#12213f", "#0d3b4f", "#112b44"]
-    for i,_ in enumerate(labels):
-        start = 360*i/n - 90
-        end   = 360*(i+1)/n - 90
-        d.pieslice([cx-r, cy-r, cx+r, cy+r], start, end, fill=palette[i%len(palette)], outline="#213a53")
-    d.ellipse([cx-r, cy-r, cx+r, cy+r], outline=GOLD, width=6)
+WHEEL_COLOURS = ("#173b5a", "#12213f", "#0d3b4f", "#112b44")
+WHEEL_EDGE    = "#213a53"
+WHEEL_LABEL_R = 40.6  # label ring, % of the disc box (~80% of the radius)
+
+@lru_cache(maxsize=2)  # one entry per heat table
+def wheel_template(n: int, cols: Optional[Tuple[str, ...]] = None) -> Template:
+    """Markup for an n-segment wheel (labelled 1..n) drawn by the browser as CSS conic gradients.
+
+    Only the spin state is left to substitute ($spinning, $angle)."""
+    colours = cols or WHEEL_COLOURS
+    k = len(colours)
+    step = 360 / n
+    stops = ", ".join(f"{colours[i % k]} {i*step:.3f}deg {(i+1)*step:.3f}deg" for i in range(n))
+    spokes = f"repeating-conic-gradient(from -0.25deg, {WHEEL_EDGE} 0deg 0.5deg, transparent 0.5deg {step:.3f}deg)"
+    ang = np.radians(step * (np.arange(n) + 0.5) - 90)
+    lefts = 50 + WHEEL_LABEL_R * np.cos(ang)
+    tops  = 50 + WHEEL_LABEL_R * np.sin(ang)
+    labels = "".join(
+        f'<span class="wheel-label" style="left:{x:.2f}%;top:{y:.2f}%">{i}</span>'
+        for i, (x, y) in enumerate(zip(lefts.tolist(), tops.tolist()), start=1)
+    )
+    return Template(
+        '<div id="wheel_disc" class="$spinning" style="--spin-deg:${angle}deg;'
+        f'background:{spokes}, conic-gradient({stops});">{labels}</div>'
+        '<div id="pointer"></div>'  # after the disc so it stacks on top
+    )
+
+# Warm both heat-table wheels at startup so the first visit to the tab is a cache hit
+for _table in (LOW_TABLE, HIGH_TABLE):
     try:
-        font = ImageFont.truetype("DejaVuSans.ttf", 14)
-    except:
-        font = ImageFont.load_default()
-    for i, lab in enumerate(labels):
-        ang = math.radians(360*(i+.5)/n - 90)
-        tx = cx + int((r-60)*math.cos(ang))
-        ty = cy + int((r-60)*math.sin(ang))
-        d.text((tx, ty), lab, fill=IVORY, font=font, anchor="mm")
-    return img
-
-def img_b64(img: Image.Image) -> str:
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    return base64.b64encode(buf.getvalue()).decode("utf-8")
+        wheel_template(len(load_complications(_table)))
+    except Exception:
+        pass  # best effort; the first render builds it instead
+
+# ---- helper: ledger table markup (plain join; no pandas formatter) ----
+LEDGER_HEAD_HTML = "<thead><tr>" + "".join(f"<th>{html.escape(c)}</th>" for c in COLUMNS) + "</tr></thead>"
+
+def ledger_html(rows: List[List]) -> str:
+    esc = html.escape
+    body = "".join(
+        "<tr>" + "".join(f"<td>{esc(str(v))}</td>" for v in row) + "</tr>"
+        for row in rows
+    )
+    return f'<table class="table table-sm text-light">{LEDGER_HEAD_HTML}<tbody>{body}</tbody></table>'
 
 # ---- helper: build the projected-points line (pure string) ----
-def projected_points_line(df: pd.DataFrame, arc: str, gold: float,
+def projected_points_line(rows: List[List], arc: str, gold: float,
                           nat20: bool, nat1: bool, notor_total: float,
                           impact: int|None, exposure: int|None, oqm: int, eb: int,
                           bonus_pct: float) -> str:
-    M  = mission_count(df)
+    M  = mission_count(rows)
     rp = renown_points_from(gold=gold, missions=M, arc=arc,
                             impact=impact, exposure=exposure, oqm=oqm, eb=eb,
                             nat20=nat20, nat1=nat1)
@@ -328,42 +554,64 @@ def projected_points_line(df: pd.DataFrame, arc: str, gold: float,
             f"Projected Notoriety Points: {np:.2f} (Gold {gold:.0f}, Missions {M})")
 
 
+def ledger_rows_from_frame(df: pd.DataFrame) -> List[List]:
+    return align_ledger_columns(df).values.tolist()
+
 # ------------------------------ Reactive State ------------------------------
 
 renown      = reactive.Value(0)
 notoriety   = reactive.Value(0)
-ward_focus  = reactive.Value("Dock")
-ledger_df   = reactive.Value(pd.DataFrame(columns=COLUMNS))
+ward_focus  = reactive.Value(WARDS[0])
+ledger_rows: List[List] = []          # ledger as plain rows in COLUMNS order; O(1) append
+ledger_version = reactive.Value(0)    # bump after mutating ledger_rows so dependants re-run
+_snapshot_version = [0]               # ledger_version last written to LEDGER_SNAPSHOT
 
 show_renown = reactive.Value(False)
 show_notor  = reactive.Value(False)
 
 last_angle       = reactive.Value(0)
 selected_index   = reactive.Value(None)  # type: ignore
-wheel_options    = reactive.Value([])    # list[str]
+wheel_options    = reactive.Value(())    # tuple[str, ...] (cached table, identity-stable)
+heat_state       = reactive.Value("Low") # "Low"/"High" band derived from notoriety
 
 queued_mission   = reactive.Value(None)  # dict or None
-spin_token = reactive.Value(None)  # bump on each spin to re-animate
+spin_token = reactive.Value(None)  # spin counter; bump on each spin to re-animate
 
 # Bootstrap from Sheets (if configured) on first session
 def _bootstrap_from_sheets():
+    # Rows logged but never sent before the last shutdown go back on the queue before
+    # anything replaces the snapshot; the forced flush below reconciles them in the background
+    pending = [] if _get_sheets_cfg()[3] else load_pending_rows()
+    sheet_queue.extend(pending)
     df, err = load_ledger_from_sheet()
     if err:
-        # No sync — fine; start empty
-        return
-    if not df.empty:
-        ledger_df.set(df)
+        # No sync — fall back to the last local snapshot (empty on first run)
+        ledger_rows[:] = load_ledger_snapshot()
+    elif not df.empty:
+        ledger_rows[:] = ledger_rows_from_frame(df)
+    # The snapshot is only written on a timer, so it can miss the newest pending rows
+    seen = {tuple(r) for r in ledger_rows}
+    ledger_rows.extend(r for r in pending if tuple(r) not in seen)
+    if not err and ledger_rows:
+        save_ledger_snapshot(ledger_rows)
+    flush_sheet_queue(force=True)
 
 
 _bootstrap_from_sheets()
 
-# --- Palette from background image ---
-def _first_existing(paths):
-    for p in paths:
-        if os.path.exists(p):
-            return p
-    return None
+def _save_snapshot_now(rows: List[List]) -> None:
+    save_ledger_snapshot(rows)
+    save_pending_rows()  # read on the worker, after any flush queued ahead of it
+
+def snapshot_ledger_if_changed() -> None:
+    """Rewrite the local snapshot on the Sheets worker if the ledger moved since the last write."""
+    with reactive.isolate():
+        v = ledger_version.get()
+    if v != _snapshot_version[0]:
+        _snapshot_version[0] = v
+        SHEETS_EXEC.submit(_save_snapshot_now, list(ledger_rows))
 
+# --- Palette from background image ---
 def _avg_rgb(path: str) -> tuple[int, int, int]:
     try:
         im = Image.open(path).convert("RGB").resize((64, 64))
@@ -408,7 +656,7 @@ html, body {{
   min-height: 100%;
   color: var(--ivory);
   background-color: var(--midnight); /* solid canvas behind the image */
-  background-image: url('data:image/png;base64,{BG_B64}');
+  background-image: url('{BG_URL}');
   background-repeat: no-repeat;
   background-position: center center;
   background-attachment: fixed;
@@ -457,7 +705,7 @@ aside.sidebar {{
 aside.sidebar .card {{ background: transparent; }}
 #sidebar-mural {{
   position: relative; height: 1120px; margin-top: 8px; z-index: 0;
-  background: url('data:image/png;base64,{MURAL_B64}') no-repeat center top / contain;
+  background: url('{MURAL_URL}') no-repeat center top / contain;
   opacity: 0.9; filter: drop-shadow(0 6px 12px rgba(0,0,0,.25));
   pointer-events: none;
 }}
@@ -569,6 +817,9 @@ aside.sidebar .card {{ background: transparent; }}
   object-fit:contain;
 }}
 
+/* The badge output container stands in for the badge itself inside the static frame */
+.kpi-crest > .shiny-html-output{{ flex:1 1 auto; min-height:0; display:flex; }}
+
 /* Text column flexes too */
 .kpi-crest .score-badge .meta{{ flex:1 1 0; min-width:0; }}
 .kpi-crest .score-badge .label{{
@@ -588,8 +839,18 @@ aside.sidebar .card {{ background: transparent; }}
 
 
 /* ---------- Wheel ---------- */
-#wheel_wrap {{ position: relative; width: 600px; margin: 0 auto; }}
-#wheel_img {{ width: 100%; height: 100%; border-radius: 50%; box-shadow: 0 10px 40px rgba(0,0,0,.55); background: radial-gradient(closest-side, rgba(255,255,255,0.06), transparent); }}
+#wheel_wrap {{ position: relative; width: {WHEEL_SIZE}px; height: {WHEEL_SIZE}px; margin: 0 auto; }}
+#wheel_wrap > #wheel_ui {{ width: 100%; height: 100%; }}
+#wheel_disc {{
+  position: absolute; inset: 6px; border-radius: 50%; border: 6px solid var(--gold);
+  box-shadow: 0 10px 40px rgba(0,0,0,.55);
+  /* Rigid-body rotation on the compositor: the gradients are painted once, only the transform changes */
+  will-change: transform; transform: rotate(var(--spin-deg, 0deg));
+}}
+.wheel-label {{
+  position: absolute; transform: translate(-50%,-50%);
+  font: 14px "DejaVu Sans", sans-serif; color: var(--ivory); pointer-events: none;
+}}
 #pointer {{
   position: absolute; top: -12px; left: 50%; transform: translateX(-50%);
   width: 0; height: 0; border-left: 16px solid transparent; border-right: 16px solid transparent;
@@ -606,7 +867,7 @@ aside.sidebar .card {{ background: transparent; }}
   color: var(--ivory);
 }}
 @keyframes wheelspin {{ from {{ transform: rotate(0deg); }} to {{ transform: rotate(var(--spin-deg, 1440deg)); }} }}
-#wheel_img.spinning {{ animation: wheelspin 3.2s cubic-bezier(.17,.67,.32,1.35); }}
+#wheel_disc.spinning {{ animation: wheelspin 3.2s cubic-bezier(.17,.67,.32,1.35); }}
 
 /* ---------- Tier tables ---------- */
 .tier-table {{ width: 100%; border-collapse: collapse; color: var(--ivory); }}
@@ -616,7 +877,11 @@ aside.sidebar .card {{ background: transparent; }}
 .tt-gold {{ color: var(--gold); }}      /* Renown labels */
 .tt-red  {{ color: var(--heat-red); }}  /* Notoriety labels */
 .ward-card{{display:flex;flex-direction:column;gap:10px}}
-.ward-preview img{{display:block;width:100%;height:auto}}
+.ward-preview img{{
+  display:block;width:100%;height:auto;border-radius:12px;
+  border:1px solid var(--gold);
+  box-shadow:0 6px 18px rgba(0,0,0,.35);
+}}
 
 /* Normalised action-strip height shared by both KPI cards */
 :root {{ --kpi-actions-h: 56px; }}
@@ -667,19 +932,39 @@ ui.head_content(ui.tags.script("""
 
 
 
-def crest_html(label: str, value: int, b64: str, dom_id: str) -> ui.HTML:
-    return ui.HTML(f"""
-    <div class="score-badge" id="{dom_id}" title="Click to view tiers">
-      <img src="data:image/png;base64,{b64}" alt="{label}">
-      <div class="meta">
-        <div class="label">{label}</div>
-        <div class="val">{value}</div>
-      </div>
+# Crest badge: everything but the numbers is baked once per crest
+CREST_TPL = Template("""
+  <div class="score-badge">
+    <img src="$src" alt="$label" />
+    <div class="meta">
+      <div class="label">$label</div>
+      <div class="val">$value</div>
+      <div class="sub">$sub</div>
     </div>
-    """)
+  </div>
+""")
+
+@lru_cache(maxsize=4)
+def _crest_shell(label: str, src: str) -> Template:
+    return Template(CREST_TPL.safe_substitute(label=label, src=src))
+
+def crest_html(label: str, src: str, total: float, sub: str) -> ui.HTML:
+    return ui.HTML(_crest_shell(label, src).substitute(value=f"{total:.1f}", sub=sub))
+
+# Ward preview and wheel result markup (static styling lives in GLOBAL_CSS)
+WARD_PREVIEW_TPL = Template("""
+  <div class="ward-preview"><img alt="$ward Ward" src="$src" /></div>
+""")
+
+RESULT_TPL = Template("""
+  <div class="result-card">
+    <div class="result-number">Result $num / $total</div>
+    <div class="result-text">$text</div>
+  </div>
+""")
 
 # Tiers HTML
-RENOWN_TIERS_HTML = f"""
+RENOWN_TIERS_HTML = """
 <div class="tiers">
   <h4>Veiled Fame — small favours from the smallfolk</h4>
   <table class="tier-table">
@@ -694,7 +979,7 @@ RENOWN_TIERS_HTML = f"""
 </div>
 """
 
-NOTOR_TIERS_HTML = f"""
+NOTOR_TIERS_HTML = """
 <div class="tiers">
   <h4>City Heat — escalating responses to vigilantism</h4>
   <table class="tier-table">
@@ -709,10 +994,15 @@ NOTOR_TIERS_HTML = f"""
 </div>
 """
 
+# Static tier UI objects, built once and reused on every toggle
+RENOWN_TIERS_UI = ui.HTML(RENOWN_TIERS_HTML)
+NOTOR_TIERS_UI  = ui.HTML(NOTOR_TIERS_HTML)
+EMPTY_UI        = ui.HTML("")
+
 # Sidebar (logo + welcome + mural)
 sidebar = ui.sidebar(
     ui.div(
-        ui.img(src=f"data:image/png;base64,{LOGO_B64}", style="width:100%;"),
+        ui.img(src=LOGO_URL, alt="Night Owls", style="width:100%;"),
         ui.div(
             ui.h3("Night Owls"),
             ui.p("By moonlight take flight,\nBy your deed will the city be freed.\nYou give a hoot!"),
@@ -792,7 +1082,11 @@ tab_resolve = ui.nav_panel(
 tab_wheel = ui.nav_panel(
     "☸️ Wheel of Fortune",
     ui.output_text("heat_caption"),
-    ui.output_ui("wheel_ui"),
+    ui.div(
+        {"id": "wheel_wrap"},
+        ui.output_ui("wheel_ui"),
+        ui.input_action_button("spin_clicked", "SPIN!", class_="spin-btn"),
+    ),
     ui.output_ui("wheel_result"),
 )
 
@@ -808,7 +1102,11 @@ tab_ledger = ui.nav_panel(
 kpi_row = ui.layout_columns(
     # --- Renown ---
     ui.card(
-        ui.output_ui("renown_badge"),
+        ui.div(  # static crest frame; only the badge numbers re-render
+            {"class": "kpi-crest", "style": "position:relative;"},
+            ui.output_ui("renown_badge"),
+            ui.input_action_button("renown_clicked", "", class_="ghost-btn"),
+        ),
         # invisible spacer that always matches the real buttons' height
         ui.div({"class": "kpi-actions placeholder"}, ui.HTML("&nbsp;")),
         ui.output_ui("_tiers_renown"),
@@ -817,7 +1115,11 @@ kpi_row = ui.layout_columns(
 
     # --- Notoriety ---
     ui.card(
-        ui.output_ui("notor_badge"),
+        ui.div(  # static crest frame; only the badge numbers re-render
+            {"class": "kpi-crest", "style": "position:relative;"},
+            ui.output_ui("notor_badge"),
+            ui.input_action_button("notor_clicked", "", class_="ghost-btn"),
+        ),
         ui.div(  # real action row
             ui.input_action_button("lie_low", "Lie Low (−1/−2 Heat)"),
             ui.input_action_button("proxy_charity", "Proxy Charity (−1 Heat)"),
@@ -831,8 +1133,7 @@ kpi_row = ui.layout_columns(
     ui.card(
         ui.div(
             ui.input_select("ward","Active Ward",
-                            choices=["Dock","Field","South","North","Castle","Trades","Sea"],
-                            selected="Dock"),
+                            choices=list(WARDS), selected=WARDS[0]),
             ui.output_ui("ward_preview"),
             class_="ward-card"
         )
@@ -844,11 +1145,15 @@ kpi_row = ui.layout_columns(
 
 app_ui = ui.page_sidebar(
     sidebar,
-    ui.head_content(ui.HTML(GLOBAL_CSS)),  # ← use head_content for 1.5
+    ui.head_content(
+        ui.HTML(GLOBAL_CSS),  # ← use head_content for 1.5
+        ui.tags.link(rel="preload", href=RENOWN_URL, as_="image"),
+        ui.tags.link(rel="preload", href=NOTOR_URL, as_="image"),
+    ),
     ui.div(
         ui.h2(APP_TITLE),
         kpi_row,
-        ui.navset_tab(tab_mission, tab_resolve, tab_wheel, tab_ledger),
+        ui.navset_tab(tab_mission, tab_resolve, tab_wheel, tab_ledger, id="main_tabs"),
         id="app-root", class_="goldrim"
     ),
     title=APP_TITLE
@@ -858,6 +1163,20 @@ app_ui = ui.page_sidebar(
 # ------------------------------ Server ------------------------------
 
 def server(input, output, session):
+    # Ledger views: rows are appended in place, a DataFrame is only built for display/export
+    @reactive.Calc
+    def ledger_snapshot() -> List[List]:
+        ledger_version.get()
+        return ledger_rows
+
+    @reactive.Calc
+    def ledger_frame() -> pd.DataFrame:
+        return pd.DataFrame(ledger_snapshot(), columns=COLUMNS)
+
+    def _append_local(row: List) -> None:
+        ledger_rows.append(row)
+        ledger_version.set(ledger_version.get() + 1)
+
     # Ward binding
     @reactive.Effect
     def _ward():
@@ -867,21 +1186,11 @@ def server(input, output, session):
     @render.ui
     def ward_preview():
         w = input.ward()
-        b64 = ward_image_b64(w)
-        if not b64:
+        src = ward_image_url(w)
+        if not src:
             # No asset found: show nothing (or swap this div for a small note if you prefer)
             return ui.HTML("")
-        return ui.HTML(
-            f"""
-            <div class="ward-preview">
-              <img alt="{w} Ward"
-                   src="data:image/png;base64,{b64}"
-                   style="display:block;width:100%;height:auto;border-radius:12px;
-                          border:1px solid var(--gold);
-                          box-shadow:0 6px 18px rgba(0,0,0,.35);" />
-            </div>
-            """
-        )
+        return ui.HTML(WARD_PREVIEW_TPL.substitute(ward=w, src=src))
 
 
     def _eb_from_roll(roll: int, nat20: bool) -> int:
@@ -905,6 +1214,9 @@ def server(input, output, session):
         return ops
 
 
+    # Derived mission inputs are Calcs, so the summaries and the queue share one evaluation
+    # per input change instead of each re-reading and re-deriving them
+    @reactive.Calc
     def _arc_params():
         arc  = input.arc()
         gold = float(input.spend())
@@ -919,6 +1231,7 @@ def server(input, output, session):
         oqm = oqm_from_inputs(arc, input)
         return arc, gold, eb, impact, exposure, oqm
 
+    @reactive.Calc
     def _narrative_bonus_pct() -> float:
         b = 0.0
         if input.flair_pass(): b += 0.10
@@ -934,20 +1247,7 @@ def server(input, output, session):
         total = renown.get()
         to_next, nxt = points_to_next(total, RENOWN_THRESH)
         sub = f'{to_next:.1f} pts to R{nxt}' if nxt else 'Max tier'
-        return ui.div(
-            {"class": "kpi-crest", "style": "position:relative;"},
-            ui.HTML(f"""
-              <div class="score-badge">
-                <img src="data:image/png;base64,{RENOWN_B64}" alt="Renown" />
-                <div class="meta">
-                  <div class="label">Renown</div>
-                  <div class="val">{total:.1f}</div>
-                  <div class="sub">{sub}</div>
-                </div>
-              </div>
-            """),
-            ui.input_action_button("renown_clicked", "", class_="ghost-btn"),
-        )
+        return crest_html("Renown", RENOWN_URL, total, sub)
 
 
     @reactive.Effect
@@ -967,20 +1267,7 @@ def server(input, output, session):
         total = notoriety.get()
         to_next, nxt = points_to_next(total, NOTORIETY_THRESH)
         sub = f'{to_next:.1f} pts to N{nxt}' if nxt else 'Max tier'
-        return ui.div(
-            {"class": "kpi-crest", "style": "position:relative;"},
-            ui.HTML(f"""
-              <div class="score-badge">
-                <img src="data:image/png;base64,{NOTOR_B64}" alt="Notoriety" />
-                <div class="meta">
-                  <div class="label">Notoriety</div>
-                  <div class="val">{total:.1f}</div>
-                  <div class="sub">{sub}</div>
-                </div>
-              </div>
-            """),
-            ui.input_action_button("notor_clicked", "", class_="ghost-btn"),
-        )
+        return crest_html("Notoriety", NOTOR_URL, total, sub)
 
 
     # Heat buttons
@@ -990,13 +1277,11 @@ def server(input, output, session):
         drop = 2 if notoriety.get() >= 10 else 1
         notoriety.set(max(0, notoriety.get() - drop))
         row = [
-            dt.datetime.now().isoformat(timespec="seconds"), ward_focus.get(),
+            now_stamp(), ward_focus.get(),
             "Adjustment: Lie Low", "-", "-", "-", 0, -drop, "-", "auto", ""
         ]
-        df = ledger_df.get().copy()
-        df.loc[len(df)] = row
-        ledger_df.set(df)
-        ok, err = append_rows_to_sheet([row])
+        _append_local(row)
+        queue_sheet_rows([row])
         # Silent soft-fail; status appears in Append All and Reload sections
 
     @reactive.Effect
@@ -1004,33 +1289,31 @@ def server(input, output, session):
     def _proxy_charity():
         notoriety.set(max(0, notoriety.get() - 1))
         row = [
-            dt.datetime.now().isoformat(timespec="seconds"), ward_focus.get(),
+            now_stamp(), ward_focus.get(),
             "Adjustment: Proxy Charity", "-", "-", "-", 0, -1, "-", "auto", ""
         ]
-        df = ledger_df.get().copy()
-        df.loc[len(df)] = row
-        ledger_df.set(df)
-        append_rows_to_sheet([row])
+        _append_local(row)
+        queue_sheet_rows([row])
 
     # Mission panel visibility controls
     def _arc_state():
         return input.arc()
 
+    @reactive.Calc
+    def _projection() -> str:
+        arc, gold, eb, impact, exposure, oqm = _arc_params()
+        return projected_points_line(ledger_snapshot(), arc, gold, input.nat20(), input.nat1(),
+                                     notoriety.get(), impact, exposure, oqm, eb, _narrative_bonus_pct())
+
     @output
     @render.text
     def base_summary():
-        arc, gold, eb, impact, exposure, oqm = _arc_params()
-        bonus = _narrative_bonus_pct()
-        return projected_points_line(ledger_df.get(), arc, gold, input.nat20(), input.nat1(),
-                                     notoriety.get(), impact, exposure, oqm, eb, bonus)
+        return _projection()
 
     @output
     @render.text
     def proj_summary():
-        arc, gold, eb, impact, exposure, oqm = _arc_params()
-        bonus = _narrative_bonus_pct()
-        return projected_points_line(ledger_df.get(), arc, gold, input.nat20(), input.nat1(),
-                                     notoriety.get(), impact, exposure, oqm, eb, bonus)
+        return _projection()
 
 
     # Queue mission
@@ -1038,7 +1321,7 @@ def server(input, output, session):
     @reactive.event(input.queue)
     def _queue():
         arc, gold, eb, impact, exposure, oqm = _arc_params()
-        M = mission_count(ledger_df.get())
+        M = mission_count(ledger_rows)
         bonus = _narrative_bonus_pct()
 
         rp = renown_points_from(gold=gold, missions=M, arc=arc,
@@ -1083,17 +1366,15 @@ def server(input, output, session):
         notoriety.set(notoriety.get() + float(q["notoriety_gain"]))
 
         row = [
-            dt.datetime.now().isoformat(timespec="seconds"),
+            now_stamp(),
             q["ward"], q["archetype"],
             q["BI"], q["EB"], q["OQM"],
             q["renown_gain"], q["notoriety_gain"],
-            json.dumps(q["EI_breakdown"]), input.notes() or "", ""
+            json_dumps(q["EI_breakdown"]), input.notes() or "", ""
         ]
-        df = ledger_df.get().copy()
-        df.loc[len(df)] = row
-        ledger_df.set(df)
+        _append_local(row)
 
-        ok, _err = append_rows_to_sheet([row])
+        queue_sheet_rows([row])
         # Optional: reload and recompute floats if you want source-of-truth from Sheets.
         queued_mission.set(None)
 
@@ -1104,60 +1385,89 @@ def server(input, output, session):
     def append_status():
         return ""
 
+    def _append_all_now(rows: List[List], queued: List[List]) -> Tuple[bool, Optional[str]]:
+        ok, err = append_rows_to_sheet(rows)
+        with _sheet_lock:
+            if ok:
+                # Drop only the queued rows this append covered; anything queued since
+                # (by any session) waits for the next flush
+                sent = {id(r) for r in queued}
+                sheet_queue[:] = [r for r in sheet_queue if id(r) not in sent]
+            _note_sheets_result(ok)
+        if ok:
+            save_pending_rows()
+        return ok, err
+
     @reactive.Effect
     @reactive.event(input.append_all)
-    def _append_all():
-        rows = ledger_df.get().values.tolist()
-        ok, err = append_rows_to_sheet(rows)
+    async def _append_all():
+        with _sheet_lock:
+            rows = list(ledger_rows)
+            queued = sheet_queue[:]
+        # Queued rows a Reload dropped from the ledger (their flush failed) still need sending
+        seen = {tuple(r) for r in rows}
+        rows += [r for r in queued if tuple(r) not in seen]
+        ok, err = await asyncio.wrap_future(SHEETS_EXEC.submit(_append_all_now, rows, queued))
         if ok:
             ui.notification_show(f"Appended {len(rows)} rows.", type="message", duration=4)
         else:
             ui.notification_show(f"Sheets error: {err or 'Unknown error'}", type="warning", duration=6)
 
-    # Wheel — options table based on heat
-    def _load_options() -> List[str]:
-        tpath = HIGH_TABLE if notoriety.get() >= 10 else LOW_TABLE
-        with open(tpath, "r") as f:
-            data = json.load(f)
-        # Force to list[str]
-        return [str(x) for x in data]
+    # Pending Sheets rows go out on tab switch and when the session closes...
+    @reactive.Effect
+    @reactive.event(input.main_tabs, ignore_init=True)
+    def _flush_on_tab():
+        flush_sheet_queue()
 
-    @output
+    def _flush_on_end():
+        flush_sheet_queue()
+        snapshot_ledger_if_changed()  # the timer stops with the session; catch its last rows
+
+    session.on_ended(_flush_on_end)
+
+    # Background flush failures this session has already been told about
+    seen_flush_error = [_flush_error[0]]
+
+    # ...and on a timer, so a burst of clicks collapses into one write without a lone row going stale
+    # (all three are skipped while a failed flush is backing off); the same tick reports new failures
+    # and rewrites the local snapshot if the ledger changed
+
+    @reactive.Effect
+    def _flush_on_timer():
+        reactive.invalidate_later(SHEETS_FLUSH_SECS)
+        flush_sheet_queue()
+        snapshot_ledger_if_changed()
+        count, msg = _flush_error
+        if count > seen_flush_error[0]:
+            seen_flush_error[0] = count
+            ui.notification_show(f"Sheets sync failed, rows kept for retry: {msg}", type="warning", duration=6)
+
+    # Wheel — options table based on heat. heat_state only changes when the band flips
+    # ("Low"/"High" are interned, so re-setting the same band is a no-op), which keeps
+    # ordinary notoriety changes from re-rendering the wheel.
+    @reactive.Effect
+    def _heat_band():
+        heat_state.set(low_or_high(notoriety.get()))
+
+    # Wheel and ledger tab outputs are suspended while their tab is hidden, so heat flips and
+    # ledger appends made from other tabs don't rebuild them until the tab is opened.
+    @output(suspend_when_hidden=True)
     @render.text
     def heat_caption():
-        return f"Heat: **{low_or_high(notoriety.get())}**"
+        return f"Heat: **{heat_state.get()}**"
 
-    @output
+    @output(suspend_when_hidden=True)
     @render.ui
     def wheel_ui():
         # Load/remember options (with fallback if JSON is missing/empty)
-        def _safe_opts():
-            tpath = HIGH_TABLE if notoriety.get() >= 10 else LOW_TABLE
-            try:
-                with open(tpath, "r") as f:
-                    data = [str(x) for x in json.load(f)]
-                return data if data else [f"Complication {i}" for i in range(1, 13)]
-            except Exception:
-                return [f"Complication {i}" for i in range(1, 13)]
-
-        opts = _safe_opts()
+        opts = load_complications(HIGH_TABLE if heat_state.get() == "High" else LOW_TABLE)
         wheel_options.set(opts)
 
-        size = 600
-        b64 = img_b64(draw_wheel([str(i + 1) for i in range(len(opts))], size=size))
         angle = last_angle.get()
         spinning = "spinning" if spin_token.get() else ""
 
-        # One container with both the image and the button as children.
-        return ui.div(
-            {"id": "wheel_wrap", "style": f"position:relative;width:{size}px;height:{size}px;margin:0 auto;"},
-            ui.HTML(f"""
-              <div id="pointer"></div>
-              <img id="wheel_img" class="{spinning}" src="data:image/png;base64,{b64}"
-                   style="--spin-deg:{angle}deg;width:100%;height:100%;border-radius:50%;" />
-            """),
-            ui.input_action_button("spin_clicked", "SPIN!", class_="spin-btn")
-        )
+        # Only the pointer + disc re-render; the SPIN button lives in the static UI
+        return ui.HTML(wheel_template(len(opts)).substitute(spinning=spinning, angle=angle))
 
 
     @reactive.Effect
@@ -1170,44 +1480,40 @@ def server(input, output, session):
         selected_index.set(idx)
         seg = 360 / n
 
-        # Guarantee a new animation cycle
-        spin_token.set(None)
-        last_angle.set(random.randint(4, 7) * 360 + (idx + 0.5) * seg)
-        spin_token.set(dt.datetime.now().isoformat())
+        # Rotate anticlockwise so the chosen segment comes to rest under the pointer
+        last_angle.set(random.randint(4, 7) * 360 - (idx + 0.5) * seg)
+        # Guarantee a new animation cycle: a counter always changes, no clock formatting needed
+        spin_token.set((spin_token.get() or 0) + 1)
 
         # Log a journal line
-        row = [dt.datetime.now().isoformat(timespec="seconds"),
+        row = [now_stamp(),
                ward_focus.get(), "Complication", "-", "-", "-", 0, 0, "-", "-", opts[idx]]
-        df = ledger_df.get().copy()
-        df.loc[len(df)] = row
-        ledger_df.set(df)
+        _append_local(row)
 
-    @output
+    @output(suspend_when_hidden=True)
     @render.ui
     def wheel_result():
         idx = selected_index.get()
         opts = wheel_options.get()
         if idx is None or not opts:
             return ui.HTML("")
-        return ui.HTML(f"""
-        <div class="result-card">
-          <div class="result-number">Result {idx+1:02d} / {len(opts):02d}</div>
-          <div class="result-text">{opts[idx]}</div>
-        </div>
-        """)
+        return ui.HTML(RESULT_TPL.substitute(num=f"{idx+1:02d}", total=f"{len(opts):02d}", text=opts[idx]))
 
     # Ledger
     @reactive.Effect
     @reactive.event(input.reload)
-    def _reload():
-        remote, err = load_ledger_from_sheet()
+    async def _reload():
+        # Queued behind any pending flush on the Sheets worker, so those rows are in the sheet first
+        flush_sheet_queue(force=True)
+        remote, err = await asyncio.wrap_future(SHEETS_EXEC.submit(load_ledger_from_sheet))
         if err:
             ui.notification_show(f"Reload failed: {err}", type="warning", duration=6)
         else:
-            ledger_df.set(remote)
-            # in _reload()
-            r = float(pd.to_numeric(remote.get("renown_gain", pd.Series()), errors="coerce").fillna(0).sum())
-            n = float(pd.to_numeric(remote.get("notoriety_gain", pd.Series()), errors="coerce").fillna(0).sum())
+            ledger_rows[:] = ledger_rows_from_frame(remote)
+            ledger_version.set(ledger_version.get() + 1)
+            # load_ledger_from_sheet already aligned the columns and coerced them to float
+            r = float(remote["renown_gain"].to_numpy().sum())
+            n = float(remote["notoriety_gain"].to_numpy().sum())
             renown.set(r); notoriety.set(n)
 
             ui.notification_show("Ledger reloaded and counters recalculated.", type="message", duration=4)
@@ -1217,31 +1523,56 @@ def server(input, output, session):
     def reload_status():
         return ""
 
-    @output
+    @output(suspend_when_hidden=True)
     @render.ui
     def ledger_table():
-        df = ledger_df.get()
-        if df.empty:
+        if not ledger_snapshot():
             return ui.div({"class":"alert alert-info goldrim", "role":"alert"}, "Ledger is empty.")
+        return ledger_view()
+
+    # Table markup is built straight from the rows, once per ledger version
+    @reactive.Calc
+    def ledger_view() -> ui.HTML:
+        rows = ledger_snapshot()
         sty = "width:100%; overflow:auto; max-height:460px; display:block;"
-        return ui.HTML(f'<div class="goldrim" style="padding:8px; {sty}">{df.to_html(index=False, classes="table table-sm text-light")}</div>')
+        note = ""
+        if len(rows) > LEDGER_VIEW_ROWS:
+            note = f'<p class="small">Showing the last {LEDGER_VIEW_ROWS} of {len(rows)} entries; download the CSV for the full ledger.</p>'
+            rows = rows[-LEDGER_VIEW_ROWS:]
+        return ui.HTML(f'{note}<div class="goldrim" style="padding:8px; {sty}">{ledger_html(rows)}</div>')
 
     # Download CSV
     @session.download(filename="night_owls_ledger.csv")
     def dl_csv():
-        df = ledger_df.get()
-        yield df.to_csv(index=False)
+        yield from ledger_csv_chunks()
+
+    # CSV blocks are encoded once per ledger version and reused across downloads
+    @reactive.Calc
+    def ledger_csv_chunks() -> Tuple[str, ...]:
+        df = ledger_frame()
+        return (df.iloc[:0].to_csv(index=False),) + tuple(
+            df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(index=False, header=False)
+            for start in range(0, len(df), CSV_CHUNK_ROWS)
+        )
+
+    # Crest tier reveals (render beneath crests) — memoised per toggle
+    @reactive.Calc
+    def _renown_tier_ui():
+        return RENOWN_TIERS_UI if show_renown.get() else EMPTY_UI
+
+    @reactive.Calc
+    def _notor_tier_ui():
+        return NOTOR_TIERS_UI if show_notor.get() else EMPTY_UI
 
-    # Crest tier reveals (render beneath crests)
     @output
     @render.ui
     def _tiers_renown():
-        return ui.HTML(RENOWN_TIERS_HTML) if show_renown.get() else ui.HTML("")
+        return _renown_tier_ui()
 
     @output
     @render.ui
     def _tiers_notor():
-        return ui.HTML(NOTOR_TIERS_HTML) if show_notor.get() else ui.HTML("")
+        return _notor_tier_ui()
 
 # Mount the app
-app = App(app_ui, server)
+app = App(app_ui, server, static_assets={f"/{ASSETS_DIR}": os.path.join(APP_DIR, ASSETS_DIR)})